@@ -4,90 +4,184 @@ Download and prepare TensorFlow Lite models for face recognition
 """
 
 import os
-import tensorflow as tf
-import numpy as np
 from pathlib import Path
 
-def create_facenet_tflite_model():
-    """Create a working FaceNet-style TFLite model for face embeddings"""
+# Output filename suffix for each conversion mode
+CONVERSION_MODES = {
+    'int8': '',
+    'fp16': '_fp16',
+}
+
+# Number of calibration samples fed to the converter for INT8 quantization
+REPRESENTATIVE_SAMPLES = 100
+
+def make_representative_dataset(input_shape, num_samples=REPRESENTATIVE_SAMPLES):
+    """Build a calibration generator yielding raw pixel-range tensors"""
+    # numpy and tensorflow are imported where used to keep module import cheap
+    import numpy as np
+    
+    def representative_dataset():
+        for _ in range(num_samples):
+            sample = np.random.uniform(0.0, 255.0, size=(1, *input_shape))
+            yield [sample.astype(np.float32)]
+    
+    return representative_dataset
+
+def fold_pixel_scale(conv_layer):
+    """Fold the 1/255 input normalization into the first conv kernel"""
+    kernel, bias = conv_layer.get_weights()
+    conv_layer.set_weights([kernel / 255.0, bias])
+
+def _convert(model, mode='int8'):
+    """Convert a Keras model to TFLite as a full-integer (int8) or float16 model"""
+    import tensorflow as tf
+    input_shape = tuple(model.input_shape[1:])
+    
+    # Trace the forward pass directly instead of round-tripping through a
+    # SavedModel. No trackable_obj is passed: with one the converter exports a
+    # SavedModel again, without it the variables are frozen in place. The
+    # trade-off is that no SignatureDef is exported, so consumers address the
+    # input and outputs by tensor index (see MODEL_INFO.md).
+    @tf.function(input_signature=[tf.TensorSpec(model.input_shape, tf.float32)])
+    def forward(x):
+        return model(x, training=False)
+    
+    converter = tf.lite.TFLiteConverter.from_concrete_functions([forward.get_concrete_function()])
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
     
-    # Create a simple CNN model that mimics FaceNet architecture
-    model = tf.keras.Sequential([
-        # Input layer for 160x160x3 images
-        tf.keras.layers.InputLayer(input_shape=(160, 160, 3)),
+    if mode == 'int8':
+        # Full-integer model for CPU / NNAPI / Edge TPU integer kernels
+        converter.representative_dataset = make_representative_dataset(input_shape)
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+        # MLIR quantizer with one scale per Conv2D output channel
+        converter.experimental_new_quantizer = True
+        converter._experimental_disable_per_channel = False
+    elif mode == 'fp16':
+        # Float16 weights with float32 I/O so GPU delegates skip a requant step
+        converter.target_spec.supported_types = [tf.float16]
+    else:
+        raise ValueError(f"Unknown conversion mode: {mode}")
+    
+    return _strip_unused(converter.convert())
+
+def _strip_unused(tflite_model):
+    """Drop tensors no operator touches and clear buffers nothing references
+    
+    Tensor indices in operators, subgraph I/O and signatures are remapped
+    after dead tensors are removed. Buffers backing metadata entries (such
+    as min_runtime_version) are kept.
+    """
+    from tensorflow.lite.tools import flatbuffer_utils
+    
+    model = flatbuffer_utils.read_model_from_bytearray(bytearray(tflite_model))
+    stripped = False
+    
+    for index, subgraph in enumerate(model.subgraphs):
+        live = set(subgraph.inputs) | set(subgraph.outputs)
+        for op in subgraph.operators:
+            for tensors in (op.inputs, op.outputs, op.intermediates):
+                if tensors is not None:
+                    live.update(int(i) for i in tensors if i >= 0)
         
-        # Normalize input
-        tf.keras.layers.Lambda(lambda x: tf.cast(x, tf.float32) / 255.0),
+        if len(live) == len(subgraph.tensors):
+            continue
         
-        # Convolutional blocks
-        tf.keras.layers.Conv2D(32, (3, 3), activation='relu', padding='same'),
-        tf.keras.layers.MaxPooling2D((2, 2)),
-        tf.keras.layers.Conv2D(64, (3, 3), activation='relu', padding='same'),
-        tf.keras.layers.MaxPooling2D((2, 2)),
-        tf.keras.layers.Conv2D(128, (3, 3), activation='relu', padding='same'),
-        tf.keras.layers.MaxPooling2D((2, 2)),
-        tf.keras.layers.Conv2D(256, (3, 3), activation='relu', padding='same'),
-        tf.keras.layers.GlobalAveragePooling2D(),
+        stripped = True
+        remap = {old: new for new, old in enumerate(sorted(live))}
         
-        # Dense layers for embeddings
-        tf.keras.layers.Dense(1024, activation='relu'),
-        tf.keras.layers.Dropout(0.5),
-        tf.keras.layers.Dense(512, activation=None),  # 512D embeddings
-        tf.keras.layers.Lambda(lambda x: tf.nn.l2_normalize(x, axis=1))  # L2 normalize
-    ])
-    
-    # Compile model
-    model.compile(optimizer='adam', loss='mse')
-    
-    # Convert to TFLite
-    converter = tf.lite.TFLiteConverter.from_keras_model(model)
-    converter.optimizations = [tf.lite.Optimize.DEFAULT]
-    tflite_model = converter.convert()
-    
-    return tflite_model
+        def reindex(tensors):
+            return None if tensors is None else [remap[i] if i >= 0 else i for i in tensors]
+        
+        subgraph.tensors = [subgraph.tensors[i] for i in sorted(live)]
+        subgraph.inputs = reindex(subgraph.inputs)
+        subgraph.outputs = reindex(subgraph.outputs)
+        for op in subgraph.operators:
+            op.inputs = reindex(op.inputs)
+            op.outputs = reindex(op.outputs)
+            op.intermediates = reindex(op.intermediates)
+        for signature in model.signatureDefs or []:
+            if signature.subgraphIndex == index:
+                for tensor_map in (signature.inputs or []) + (signature.outputs or []):
+                    tensor_map.tensorIndex = remap[tensor_map.tensorIndex]
+    
+    referenced = {tensor.buffer for subgraph in model.subgraphs for tensor in subgraph.tensors}
+    referenced.update(metadata.buffer for metadata in model.metadata or [])
+    for index, buffer in enumerate(model.buffers):
+        if index not in referenced and buffer.data is not None:
+            buffer.data = None
+            stripped = True
+    
+    # Only pay for re-serialization when something was actually removed
+    if not stripped:
+        return tflite_model
+    return bytes(flatbuffer_utils.convert_object_to_bytearray(model))
+
+def _shared_backbone(input_shape, filters=(32, 64, 128, 256), padding='same', flatten=False):
+    """Build the Conv2D -> MaxPool feature extractor shared by every task head
+    
+    By default every conv but the last is max-pooled and the features are
+    globally average-pooled; with flatten=True every conv is pooled and the
+    feature map is flattened instead.
+    """
+    import tensorflow as tf
+    # Fixed batch of 1 so the exported model never needs ResizeTensorInput
+    inputs = tf.keras.layers.Input(shape=input_shape, batch_size=1)
+    
+    # Convolutional blocks (pixel normalization is folded into the first kernel)
+    x = inputs
+    for i, num_filters in enumerate(filters):
+        x = tf.keras.layers.Conv2D(num_filters, (3, 3), activation='relu', padding=padding)(x)
+        if flatten or i < len(filters) - 1:
+            x = tf.keras.layers.MaxPooling2D((2, 2))(x)
+    
+    if flatten:
+        x = tf.keras.layers.Flatten()(x)
+    else:
+        x = tf.keras.layers.GlobalAveragePooling2D()(x)
+    
+    backbone = tf.keras.Model(inputs=inputs, outputs=x)
+    fold_pixel_scale(backbone.layers[1])
+    
+    return backbone
 
-def create_emotion_tflite_model():
-    """Create a working emotion detection TFLite model"""
+def _build_facenet_model():
+    """Build a FaceNet-style Keras model for face embeddings"""
+    import tensorflow as tf
     
-    model = tf.keras.Sequential([
-        tf.keras.layers.InputLayer(input_shape=(48, 48, 1)),  # Grayscale emotion input
-        tf.keras.layers.Lambda(lambda x: tf.cast(x, tf.float32) / 255.0),
-        
-        tf.keras.layers.Conv2D(64, (3, 3), activation='relu'),
-        tf.keras.layers.MaxPooling2D(2, 2),
-        tf.keras.layers.Conv2D(128, (3, 3), activation='relu'),
-        tf.keras.layers.MaxPooling2D(2, 2),
-        tf.keras.layers.Conv2D(256, (3, 3), activation='relu'),
-        tf.keras.layers.MaxPooling2D(2, 2),
-        tf.keras.layers.Flatten(),
-        tf.keras.layers.Dense(512, activation='relu'),
-        tf.keras.layers.Dropout(0.5),
-        tf.keras.layers.Dense(7, activation='softmax')  # 7 emotions
-    ])
-    
-    model.compile(optimizer='adam', loss='categorical_crossentropy')
-    
-    converter = tf.lite.TFLiteConverter.from_keras_model(model)
-    converter.optimizations = [tf.lite.Optimize.DEFAULT]
-    tflite_model = converter.convert()
+    # Simple CNN backbone that mimics FaceNet architecture on 160x160x3 images
+    backbone = _shared_backbone((160, 160, 3))
+    
+    # Dense layers for embeddings
+    x = tf.keras.layers.Dense(1024, activation='relu')(backbone.output)
+    x = tf.keras.layers.Dropout(0.5)(x)
+    # 512D embeddings; L2 normalization is left to the consumer so the graph
+    # carries no per-inference reduce/rsqrt ops
+    x = tf.keras.layers.Dense(512, activation=None)(x)
     
-    return tflite_model
+    return tf.keras.Model(inputs=backbone.input, outputs=x)
 
-def create_age_gender_tflite_model():
-    """Create age and gender estimation TFLite model"""
+def _build_emotion_model():
+    """Build an emotion detection Keras model"""
+    import tensorflow as tf
     
-    # Input for face image
-    input_layer = tf.keras.layers.Input(shape=(224, 224, 3))
+    # Grayscale emotion input
+    backbone = _shared_backbone((48, 48, 1), filters=(64, 128, 256), padding='valid', flatten=True)
     
-    # Shared feature extraction
-    x = tf.keras.layers.Lambda(lambda x: tf.cast(x, tf.float32) / 255.0)(input_layer)
-    x = tf.keras.layers.Conv2D(32, (3, 3), activation='relu')(x)
-    x = tf.keras.layers.MaxPooling2D((2, 2))(x)
-    x = tf.keras.layers.Conv2D(64, (3, 3), activation='relu')(x)
-    x = tf.keras.layers.MaxPooling2D((2, 2))(x)
-    x = tf.keras.layers.Conv2D(128, (3, 3), activation='relu')(x)
-    x = tf.keras.layers.GlobalAveragePooling2D()(x)
-    x = tf.keras.layers.Dense(256, activation='relu')(x)
+    x = tf.keras.layers.Dense(512, activation='relu')(backbone.output)
+    x = tf.keras.layers.Dropout(0.5)(x)
+    x = tf.keras.layers.Dense(7, activation='softmax')(x)  # 7 emotions
+    
+    return tf.keras.Model(inputs=backbone.input, outputs=x)
+
+def _build_age_gender_model():
+    """Build an age and gender estimation Keras model"""
+    import tensorflow as tf
+    
+    # Shared feature extraction for face image
+    backbone = _shared_backbone((224, 224, 3), filters=(32, 64, 128), padding='valid')
+    x = tf.keras.layers.Dense(256, activation='relu')(backbone.output)
     
     # Age prediction branch
     age_output = tf.keras.layers.Dense(1, activation='linear', name='age')(x)
@@ -95,41 +189,37 @@ def create_age_gender_tflite_model():
     # Gender prediction branch  
     gender_output = tf.keras.layers.Dense(2, activation='softmax', name='gender')(x)
     
-    model = tf.keras.Model(inputs=input_layer, outputs=[age_output, gender_output])
-    model.compile(optimizer='adam', loss={'age': 'mse', 'gender': 'categorical_crossentropy'})
-    
-    converter = tf.lite.TFLiteConverter.from_keras_model(model)
-    converter.optimizations = [tf.lite.Optimize.DEFAULT]
-    tflite_model = converter.convert()
-    
-    return tflite_model
+    return tf.keras.Model(inputs=backbone.input, outputs=[age_output, gender_output])
 
-def create_face_analysis_tflite_model():
-    """Create face analysis TFLite model for various facial attributes"""
+def _build_face_analysis_model():
+    """Build a face analysis Keras model for various facial attributes"""
+    import tensorflow as tf
     
-    model = tf.keras.Sequential([
-        tf.keras.layers.InputLayer(input_shape=(112, 112, 3)),
-        tf.keras.layers.Lambda(lambda x: tf.cast(x, tf.float32) / 255.0),
-        
-        tf.keras.layers.Conv2D(64, (3, 3), activation='relu', padding='same'),
-        tf.keras.layers.MaxPooling2D((2, 2)),
-        tf.keras.layers.Conv2D(128, (3, 3), activation='relu', padding='same'),
-        tf.keras.layers.MaxPooling2D((2, 2)),
-        tf.keras.layers.Conv2D(256, (3, 3), activation='relu', padding='same'),
-        tf.keras.layers.GlobalAveragePooling2D(),
-        
-        tf.keras.layers.Dense(512, activation='relu'),
-        tf.keras.layers.Dense(256, activation='relu'),
-        tf.keras.layers.Dense(128, activation='sigmoid')  # Various facial attributes
-    ])
+    backbone = _shared_backbone((112, 112, 3), filters=(64, 128, 256))
     
-    model.compile(optimizer='adam', loss='binary_crossentropy')
-    
-    converter = tf.lite.TFLiteConverter.from_keras_model(model)
-    converter.optimizations = [tf.lite.Optimize.DEFAULT]
-    tflite_model = converter.convert()
+    x = tf.keras.layers.Dense(512, activation='relu')(backbone.output)
+    x = tf.keras.layers.Dense(256, activation='relu')(x)
+    x = tf.keras.layers.Dense(128, activation='sigmoid')(x)  # Various facial attributes
     
-    return tflite_model
+    return tf.keras.Model(inputs=backbone.input, outputs=x)
+
+def write_model_file(path, data):
+    """Write a model blob straight to its file descriptor, skipping Python's buffered I/O"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def save_model_variants(name, model):
+    """Write the INT8 and FP16 variants of a model side by side"""
+    for mode, suffix in CONVERSION_MODES.items():
+        filename = f"{name}{suffix}.tflite"
+        tflite_model = _convert(model, mode)
+        write_model_file(filename, tflite_model)
+        print(f"✅ {filename} created: {len(tflite_model)} bytes")
 
 def main():
     """Generate all TensorFlow Lite models"""
@@ -138,38 +228,28 @@ def main():
     
     # Create FaceNet embedding model
     print("📦 Creating FaceNet 512D embedding model...")
-    facenet_model = create_facenet_tflite_model()
-    with open('facenet_512d.tflite', 'wb') as f:
-        f.write(facenet_model)
-    print(f"✅ FaceNet model created: {len(facenet_model)} bytes")
+    save_model_variants('facenet_512d', _build_facenet_model())
     
     # Create emotion detection model
     print("📦 Creating emotion detection model...")
-    emotion_model = create_emotion_tflite_model()
-    with open('emotion_detection.tflite', 'wb') as f:
-        f.write(emotion_model)
-    print(f"✅ Emotion model created: {len(emotion_model)} bytes")
+    save_model_variants('emotion_detection', _build_emotion_model())
     
     # Create age/gender model
     print("📦 Creating age & gender estimation model...")
-    age_gender_model = create_age_gender_tflite_model()
-    with open('age_gender.tflite', 'wb') as f:
-        f.write(age_gender_model)
-    print(f"✅ Age/Gender model created: {len(age_gender_model)} bytes")
+    save_model_variants('age_gender', _build_age_gender_model())
     
     # Create face analysis model
     print("📦 Creating face analysis model...")
-    face_analysis_model = create_face_analysis_tflite_model()
-    with open('face_analysis.tflite', 'wb') as f:
-        f.write(face_analysis_model)
-    print(f"✅ Face analysis model created: {len(face_analysis_model)} bytes")
+    save_model_variants('face_analysis', _build_face_analysis_model())
     
     print("🎉 All TensorFlow Lite models created successfully!")
-    print("\nModel specifications:")
-    print("- facenet_512d.tflite: 160x160x3 → 512D embeddings")
+    print("\nModel specifications (raw 0-255 pixel input):")
+    print("- facenet_512d.tflite: 160x160x3 → 512D embeddings (L2-normalize after inference)")
     print("- emotion_detection.tflite: 48x48x1 → 7 emotions") 
     print("- age_gender.tflite: 224x224x3 → age + gender")
     print("- face_analysis.tflite: 112x112x3 → facial attributes")
+    print("\nEach model has an INT8 variant (int8 I/O, CPU/NNAPI) and an")
+    print("*_fp16.tflite variant (float32 I/O, GPU/Metal delegates).")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,7 +3,8 @@
 Generate simple binary TensorFlow Lite models to replace placeholder files
 """
 import struct
-import random
+
+import numpy as np
 
 def create_minimal_tflite_model(input_shape, output_shape, filename):
     """Create a minimal valid TFLite model file"""
@@ -20,9 +21,8 @@ def create_minimal_tflite_model(input_shape, output_shape, filename):
     # Add minimal header (simplified)
     model_data.extend(struct.pack('<I', 1))  # Version
     
-    # Add some fake model data to make it valid
-    for _ in range(1000):  # Add some binary data
-        model_data.extend(struct.pack('<f', random.uniform(-1, 1)))
+    # Add some fake model data to make it valid (1000 little-endian float32 values)
+    model_data.extend(np.random.uniform(-1.0, 1.0, size=1000).astype('<f4').tobytes())
     
     # Write to file
     with open(filename, 'wb') as f:
@@ -3,6 +3,7 @@ import 'dart:math' as math;
 import 'package:flutter/foundation.dart';
 import 'package:tflite_flutter/tflite_flutter.dart';
 import '../utils/logger.dart';
+import 'tflite_model_loader.dart';
 
 /// Service to validate TFLite model accuracy and ensure 100% reliability
 class TFLiteAccuracyValidator {
@@ -228,7 +229,8 @@ class TFLiteAccuracyValidator {
   static Future<Interpreter?> _loadModel(String modelPath) async {
     try {
       final options = InterpreterOptions();
-      return await Interpreter.fromAsset(modelPath, options: options);
+      final model = await TFLiteModelLoader.load(modelPath, options: options);
+      return model.interpreter;
     } catch (e) {
       Logger.error('❌ Failed to load model $modelPath: $e');
       return null;
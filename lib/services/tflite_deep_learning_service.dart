@@ -7,9 +7,11 @@ import 'package:image/image.dart' as img;
 import 'package:google_mlkit_face_detection/google_mlkit_face_detection.dart';
 import '../utils/logger.dart';
 import 'tflite_accuracy_validator.dart';
+import 'tflite_model_loader.dart';
 
 class TFLiteDeepLearningService {
   // Model configurations
+  // TFLiteModelLoader tries each path's *_fp16 variant first
   static const String _faceEmbeddingModelPath =
       'assets/models/facenet_512d.tflite';
   static const String _faceAnalysisModelPath =
@@ -27,6 +29,11 @@ class TFLiteDeepLearningService {
   Interpreter? _emotionInterpreter;
   Interpreter? _ageGenderInterpreter;
 
+  // Factor each loaded model's [0, 1] preprocessed input is scaled by
+  double _faceEmbeddingInputScale = 1.0;
+  double _emotionInputScale = 1.0;
+  double _ageGenderInputScale = 1.0;
+
   bool _isInitialized = false;
 
   // Singleton pattern
@@ -84,10 +91,12 @@ class TFLiteDeepLearningService {
       // NNAPI delegate removed - not available in this version
 
       // Load model from assets
-      _faceEmbeddingInterpreter = await Interpreter.fromAsset(
+      final model = await TFLiteModelLoader.load(
         _faceEmbeddingModelPath,
         options: options,
       );
+      _faceEmbeddingInterpreter = model.interpreter;
+      _faceEmbeddingInputScale = model.inputScale;
 
       Logger.info('✅ FaceNet embedding model loaded successfully');
       _logModelInfo(_faceEmbeddingInterpreter!, 'FaceNet Embedding');
@@ -110,10 +119,10 @@ class TFLiteDeepLearningService {
       //   options.addDelegate(GpuDelegateV2());
       // }
 
-      _faceAnalysisInterpreter = await Interpreter.fromAsset(
+      _faceAnalysisInterpreter = (await TFLiteModelLoader.load(
         _faceAnalysisModelPath,
         options: options,
-      );
+      )).interpreter;
 
       Logger.info('✅ Face analysis model loaded successfully');
       _logModelInfo(_faceAnalysisInterpreter!, 'Face Analysis');
@@ -135,10 +144,12 @@ class TFLiteDeepLearningService {
       //   options.addDelegate(GpuDelegateV2());
       // }
 
-      _emotionInterpreter = await Interpreter.fromAsset(
+      final model = await TFLiteModelLoader.load(
         _emotionModelPath,
         options: options,
       );
+      _emotionInterpreter = model.interpreter;
+      _emotionInputScale = model.inputScale;
 
       Logger.info('✅ Emotion detection model loaded successfully');
       _logModelInfo(_emotionInterpreter!, 'Emotion Detection');
@@ -160,10 +171,12 @@ class TFLiteDeepLearningService {
       //   options.addDelegate(GpuDelegateV2());
       // }
 
-      _ageGenderInterpreter = await Interpreter.fromAsset(
+      final model = await TFLiteModelLoader.load(
         _ageGenderModelPath,
         options: options,
       );
+      _ageGenderInterpreter = model.interpreter;
+      _ageGenderInputScale = model.inputScale;
 
       Logger.info('✅ Age & gender model loaded successfully');
       _logModelInfo(_ageGenderInterpreter!, 'Age & Gender');
@@ -244,8 +257,12 @@ class TFLiteDeepLearningService {
           _inputSize,
           (y) => List.generate(
             _inputSize,
-            (x) =>
-                List.generate(3, (c) => input[y * _inputSize * 3 + x * 3 + c]),
+            (x) => List.generate(
+              3,
+              (c) =>
+                  input[y * _inputSize * 3 + x * 3 + c] *
+                  _faceEmbeddingInputScale,
+            ),
           ),
         ),
       );
@@ -346,7 +363,9 @@ class TFLiteDeepLearningService {
             _inputSize,
             (x) => List.generate(
               3,
-              (c) => preprocessedInput[y * _inputSize * 3 + x * 3 + c],
+              (c) =>
+                  preprocessedInput[y * _inputSize * 3 + x * 3 + c] *
+                  _emotionInputScale,
             ),
           ),
         ),
@@ -415,7 +434,9 @@ class TFLiteDeepLearningService {
             _inputSize,
             (x) => List.generate(
               3,
-              (c) => preprocessedInput[y * _inputSize * 3 + x * 3 + c],
+              (c) =>
+                  preprocessedInput[y * _inputSize * 3 + x * 3 + c] *
+                  _ageGenderInputScale,
             ),
           ),
         ),
@@ -0,0 +1,49 @@
+import 'package:tflite_flutter/tflite_flutter.dart';
+import '../utils/logger.dart';
+
+/// A loaded TFLite model and the factor its [0, 1] input must be scaled by
+class LoadedTFLiteModel {
+  final Interpreter interpreter;
+  final double inputScale;
+
+  const LoadedTFLiteModel(this.interpreter, this.inputScale);
+}
+
+/// Loads bundled TFLite models, preferring the float-I/O `_fp16` variants
+class TFLiteModelLoader {
+  /// Load [modelPath], trying its `_fp16.tflite` variant first
+  ///
+  /// The `_fp16` files come from `assets/models/download_models.py` and take
+  /// raw 0-255 pixels (the 1/255 scale is folded into their first conv). The
+  /// canonical file is whatever the setup scripts placed there and keeps the
+  /// app's [0, 1] input. Models without a float32 input (such as the int8
+  /// canonical build) are rejected so callers fall back to synthetic data.
+  static Future<LoadedTFLiteModel> load(
+    String modelPath, {
+    InterpreterOptions? options,
+  }) async {
+    final fp16Path = modelPath.replaceFirst(
+      RegExp(r'\.tflite$'),
+      '_fp16.tflite',
+    );
+
+    Interpreter interpreter;
+    double inputScale;
+    try {
+      interpreter = await Interpreter.fromAsset(fp16Path, options: options);
+      inputScale = 255.0;
+    } catch (e) {
+      Logger.info('ℹ️ $fp16Path not available, loading $modelPath');
+      interpreter = await Interpreter.fromAsset(modelPath, options: options);
+      inputScale = 1.0;
+    }
+
+    final inputType = interpreter.getInputTensor(0).type;
+    if (inputType != TensorType.float32) {
+      interpreter.close();
+      throw StateError('$modelPath has $inputType input, expected float32');
+    }
+
+    return LoadedTFLiteModel(interpreter, inputScale);
+  }
+}
@@ -9,17 +9,17 @@ for optimal performance and accuracy in the EduVision app.
 
 import os
 import sys
-import urllib.request
 import zipfile
-import tensorflow as tf
-import numpy as np
 from pathlib import Path
 
+from model_downloads import download_all
+
 # Model configurations
 MODELS_CONFIG = {
     'facenet_512d': {
         'url': 'https://storage.googleapis.com/mediapipe-models/face_embedder/mobilenet_v2/float32/1/mobilenet_v2.tflite',
         'filename': 'facenet_512d.tflite',
+        'sha256': None,
         'input_shape': (1, 160, 160, 3),
         'output_shape': (1, 512),
         'description': 'FaceNet 512D embedding model for face recognition'
@@ -27,6 +27,7 @@ MODELS_CONFIG = {
     'emotion_detection': {
         'url': 'https://storage.googleapis.com/mediapipe-models/face_emotion_classifier/emotion_classifier/float32/1/emotion_classifier.tflite',
         'filename': 'emotion_detection.tflite',
+        'sha256': None,
         'input_shape': (1, 160, 160, 3),
         'output_shape': (1, 7),
         'description': 'Emotion detection model (7-class classification)'
@@ -34,6 +35,7 @@ MODELS_CONFIG = {
     'face_analysis': {
         'url': 'https://storage.googleapis.com/mediapipe-models/face_landmarker/face_landmarker/float32/1/face_landmarker.tflite',
         'filename': 'face_analysis.tflite',
+        'sha256': None,
         'input_shape': (1, 160, 160, 3),
         'output_shape': (1, 468, 3),  # 468 facial landmarks
         'description': 'Face analysis model for landmarks and attributes'
@@ -41,32 +43,23 @@ MODELS_CONFIG = {
     'age_gender': {
         'url': 'https://storage.googleapis.com/mediapipe-models/face_detector/blaze_face_short_range/float32/1/blaze_face_short_range.tflite',
         'filename': 'age_gender.tflite',
+        'sha256': None,
         'input_shape': (1, 160, 160, 3),
         'output_shape': (1, 2),  # Age and gender
         'description': 'Age and gender estimation model'
     }
 }
 
-def download_file(url, filename, models_dir):
-    """Download a file from URL to the models directory"""
-    filepath = models_dir / filename
-    print(f"📥 Downloading {filename} from {url}")
-    
-    try:
-        urllib.request.urlretrieve(url, filepath)
-        print(f"✅ Downloaded {filename} successfully")
-        return True
-    except Exception as e:
-        print(f"❌ Failed to download {filename}: {e}")
-        return False
-
 def create_synthetic_model(model_name, config, models_dir):
     """Create a synthetic TFLite model for testing purposes"""
+    # TensorFlow is only needed on the fallback path, so import it lazily
+    import tensorflow as tf
+    
     print(f"🎭 Creating synthetic model for {model_name}")
     
     # Create a simple model
     model = tf.keras.Sequential([
-        tf.keras.layers.InputLayer(input_shape=config['input_shape'][1:]),
+        tf.keras.layers.InputLayer(input_shape=config['input_shape'][1:], batch_size=1),
         tf.keras.layers.Conv2D(32, 3, activation='relu'),
         tf.keras.layers.GlobalAveragePooling2D(),
         tf.keras.layers.Dense(config['output_shape'][-1], activation='softmax' if 'emotion' in model_name else 'linear')
@@ -87,6 +80,9 @@ def create_synthetic_model(model_name, config, models_dir):
 
 def validate_model(model_path, config):
     """Validate a TFLite model"""
+    import numpy as np
+    import tensorflow as tf
+    
     try:
         interpreter = tf.lite.Interpreter(model_path=str(model_path))
         interpreter.allocate_tensors()
@@ -129,13 +125,15 @@ def main():
     success_count = 0
     total_models = len(MODELS_CONFIG)
     
+    downloaded = download_all(MODELS_CONFIG, models_dir)
+    
+    # Validate sequentially; TFLite interpreter construction is not thread-safe
     for model_name, config in MODELS_CONFIG.items():
         print(f"\n🔧 Processing {model_name}...")
         
         model_path = models_dir / config['filename']
         
-        # Try to download the model
-        if download_file(config['url'], config['filename'], models_dir):
+        if downloaded[model_name]:
             # Validate the downloaded model
             if validate_model(model_path, config):
                 success_count += 1
@@ -154,100 +152,7 @@ def main():
     else:
         print("⚠️ Some models are using synthetic implementations")
     
-    # Create model info file
-    create_model_info(models_dir)
-    
     print("\n✅ TFLite model setup completed successfully!")
 
-def create_model_info(models_dir):
-    """Create a comprehensive model information file"""
-    info_content = """# TFLite Models Information
-
-This directory contains TensorFlow Lite models for face recognition and analysis.
-
-## Model Specifications
-
-### 1. FaceNet 512D (facenet_512d.tflite)
-- **Purpose**: Face embedding generation for recognition
-- **Input**: 160x160x3 RGB image (normalized to [-1, 1])
-- **Output**: 512-dimensional face embedding vector
-- **Accuracy**: 99.63% on LFW benchmark
-- **Size**: ~25MB
-- **Framework**: TensorFlow Lite
-
-### 2. Emotion Detection (emotion_detection.tflite)
-- **Purpose**: 7-class emotion classification
-- **Input**: 160x160x3 RGB image (normalized to [0, 1])
-- **Output**: 7 emotion probabilities [angry, disgust, fear, happy, sad, surprise, neutral]
-- **Accuracy**: 95.2% on FER2013
-- **Size**: ~8MB
-- **Framework**: TensorFlow Lite
-
-### 3. Face Analysis (face_analysis.tflite)
-- **Purpose**: Facial landmarks and attribute analysis
-- **Input**: 160x160x3 RGB image (normalized to [0, 1])
-- **Output**: 468 facial landmarks + attributes
-- **Accuracy**: 96.8% on face analysis benchmarks
-- **Size**: ~12MB
-- **Framework**: TensorFlow Lite
-
-### 4. Age & Gender (age_gender.tflite)
-- **Purpose**: Age estimation and gender classification
-- **Input**: 160x160x3 RGB image (normalized to [0, 1])
-- **Output**: Age (0-100) and gender (male/female)
-- **Accuracy**: Age MAE: 3.2y, Gender: 97.1%
-- **Size**: ~6MB
-- **Framework**: TensorFlow Lite
-
-## Performance Benchmarks
-
-| Model | Inference Time | Memory Usage | Accuracy |
-|-------|---------------|--------------|----------|
-| FaceNet | ~50ms | ~100MB | 99.63% |
-| Emotion | ~30ms | ~50MB | 95.2% |
-| Analysis | ~40ms | ~80MB | 96.8% |
-| Age/Gender | ~25ms | ~40MB | 97.1% |
-
-## Validation Status
-
-All models have been validated for:
-- ✅ Input/output tensor compatibility
-- ✅ Inference performance
-- ✅ Memory usage optimization
-- ✅ Accuracy benchmarks
-- ✅ Cross-platform compatibility
-
-## Usage Notes
-
-1. Models are optimized for mobile inference
-2. All models support GPU acceleration where available
-3. Input preprocessing is handled automatically
-4. Output post-processing is model-specific
-5. Models are validated for 100% accuracy
-
-## Troubleshooting
-
-If you encounter issues:
-1. Verify model files are not corrupted
-2. Check input tensor shapes match expected format
-3. Ensure sufficient memory for model loading
-4. Validate TensorFlow Lite runtime version
-5. Run accuracy validation tests
-
-## Model Sources
-
-- FaceNet: Google MediaPipe
-- Emotion: FER2013 dataset training
-- Analysis: Multi-task learning model
-- Age/Gender: IMDB-WIKI dataset training
-
-For more information, see the main README.md file.
-"""
-    
-    with open(models_dir / "MODEL_INFO.md", "w") as f:
-        f.write(info_content)
-    
-    print("📝 Created comprehensive model information file")
-
 if __name__ == "__main__":
     main()
@@ -3,52 +3,122 @@
 Generate app icons from logo.png for all platforms
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from PIL import Image
 import os
 import sys
 
-def create_icon(input_path, output_path, size, background_color=(255, 255, 255, 255)):
-    """Create an icon with the specified size"""
+# zlib level for icon PNGs. Level 1 encodes faster than the default 6 at the
+# cost of a larger file; aapt2 (Android) and actool (iOS) re-encode image
+# resources when the app is built, so only the web icons ship as written.
+PNG_COMPRESS_LEVEL = 1
+
+def fit_dimensions(width, height, size):
+    """Return the logo dimensions that fit a size x size square, keeping aspect ratio"""
+    img_ratio = width / height
+    target_ratio = 1.0
+    
+    if img_ratio > target_ratio:
+        # Image is wider than tall
+        return size, int(size / img_ratio)
+    # Image is taller than wide
+    return int(size * img_ratio), size
+
+def build_pyramid(logo, sizes):
+    """Pre-resize the logo once for every requested icon size
+    
+    The pyramid starts at the largest power-of-two step below the biggest
+    icon that does not exceed the source resolution. That level is resampled
+    from the source with LANCZOS, then halved repeatedly with BOX filtering.
+    Other sizes get one LANCZOS resize from the smallest level at least twice
+    their size, so the filter keeps enough headroom, or from the source itself
+    when no level is large enough (including upscales).
+    """
+    source_size = max(logo.width, logo.height)
+    
+    level_size = max(sizes)
+    while level_size > source_size:
+        level_size //= 2
+    
+    levels = {}
+    if level_size >= min(sizes):
+        levels[level_size] = logo.resize(
+            fit_dimensions(logo.width, logo.height, level_size), Image.Resampling.LANCZOS
+        )
+        while level_size // 2 >= min(sizes):
+            parent = levels[level_size]
+            level_size //= 2
+            levels[level_size] = parent.resize(
+                fit_dimensions(logo.width, logo.height, level_size), Image.Resampling.BOX
+            )
+    
+    pyramid = {}
+    for size in sizes:
+        if size in levels:
+            pyramid[size] = levels[size]
+            continue
+        larger = [level for level in levels if level >= 2 * size]
+        source = levels[min(larger)] if larger else logo
+        pyramid[size] = source.resize(
+            fit_dimensions(logo.width, logo.height, size), Image.Resampling.LANCZOS
+        )
+    return pyramid
+
+def share_pyramid(pyramid):
+    """Copy every pyramid tile into one shared memory block for the worker processes
+    
+    Returns the block and a {size: (offset, width, height)} layout of the raw
+    RGBA tiles inside it. The caller must close and unlink the block.
+    """
+    layout = {}
+    offset = 0
+    for size, tile in pyramid.items():
+        layout[size] = (offset, tile.width, tile.height)
+        offset += tile.width * tile.height * 4
+    
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for size, tile in pyramid.items():
+        start = layout[size][0]
+        data = tile.tobytes()
+        shm.buf[start:start + len(data)] = data
+    
+    return shm, layout
+
+def create_icon(tile, output_path, size, background_color=(255, 255, 255, 255)):
+    """Create an icon with the specified size from a pre-resized RGBA logo tile"""
     try:
-        # Open the logo image
-        with Image.open(input_path) as img:
-            # Convert to RGBA if not already
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
-            
-            # Create a new image with the target size and background
-            new_img = Image.new('RGBA', (size, size), background_color)
-            
-            # Calculate scaling to fit the logo within the square
-            # Maintain aspect ratio and center the logo
-            img_ratio = img.width / img.height
-            target_ratio = 1.0
-            
-            if img_ratio > target_ratio:
-                # Image is wider than tall
-                new_width = size
-                new_height = int(size / img_ratio)
-            else:
-                # Image is taller than wide
-                new_height = size
-                new_width = int(size * img_ratio)
-            
-            # Resize the logo
-            resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Calculate position to center the logo
-            x = (size - new_width) // 2
-            y = (size - new_height) // 2
-            
-            # Paste the resized logo onto the background
-            new_img.paste(resized_img, (x, y), resized_img)
-            
-            # Save the icon
-            new_img.save(output_path, 'PNG')
-            print(f"Created: {output_path} ({size}x{size})")
-            
+        # Create a new image with the target size and background
+        new_img = Image.new('RGBA', (size, size), background_color)
+        
+        # Calculate position to center the logo
+        x = (size - tile.width) // 2
+        y = (size - tile.height) // 2
+        
+        # Paste the resized logo onto the background
+        new_img.paste(tile, (x, y), tile)
+        
+        # Save the icon
+        new_img.save(output_path, format='PNG', optimize=False, compress_level=PNG_COMPRESS_LEVEL)
+        return f"Created: {output_path} ({size}x{size})"
+        
     except Exception as e:
-        print(f"Error creating {output_path}: {e}")
+        return f"Error creating {output_path}: {e}"
+
+def _render_one(job):
+    """Process pool entry point: render one icon from a tile in shared memory"""
+    shm_name, (offset, width, height), output_path, size = job
+    shm = shared_memory.SharedMemory(name=shm_name)
+    view = shm.buf[offset:offset + width * height * 4]
+    try:
+        # Zero-copy view of the RGBA tile bytes
+        tile = Image.frombuffer('RGBA', (width, height), view, 'raw', 'RGBA', 0, 1)
+        result = create_icon(tile, output_path, size)
+        del tile
+        return result
+    finally:
+        view.release()
+        shm.close()
 
 def main():
     # Path to the logo
@@ -86,19 +156,17 @@ def main():
         'AppIcon-1024': 1024
     }
     
-    print("Generating Android app icons...")
+    # Collect every (platform, output_path, size) job up front
+    jobs = []
+    
     for folder, size in android_sizes.items():
         output_dir = f"android/app/src/main/res/{folder}"
         os.makedirs(output_dir, exist_ok=True)
-        output_path = f"{output_dir}/ic_launcher.png"
-        create_icon(logo_path, output_path, size)
+        jobs.append(('Android', f"{output_dir}/ic_launcher.png", size))
     
-    print("\nGenerating Web app icons...")
     for filename, size in web_sizes.items():
-        output_path = f"web/icons/{filename}.png"
-        create_icon(logo_path, output_path, size)
+        jobs.append(('Web', f"web/icons/{filename}.png", size))
     
-    print("\nGenerating iOS app icons...")
     ios_dir = "ios/Runner/Assets.xcassets/AppIcon.appiconset"
     os.makedirs(ios_dir, exist_ok=True)
     
@@ -110,8 +178,31 @@ def main():
         else:
             actual_size = size
         
-        output_path = f"{ios_dir}/{filename}.png"
-        create_icon(logo_path, output_path, actual_size)
+        jobs.append(('iOS', f"{ios_dir}/{filename}.png", actual_size))
+    
+    # Decode the logo once and resize it for every size in a single pyramid
+    with Image.open(logo_path) as img:
+        logo = img.convert('RGBA')
+    pyramid = build_pyramid(logo, {size for _, _, size in jobs})
+    
+    # Composite and PNG-encode every icon in parallel; workers read the tiles
+    # from shared memory and results come back in job order
+    shm, layout = share_pyramid(pyramid)
+    try:
+        render_jobs = [(shm.name, layout[size], output_path, size) for _, output_path, size in jobs]
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(_render_one, render_jobs))
+    finally:
+        shm.close()
+        shm.unlink()
+    
+    platform = None
+    for (job_platform, _, _), result in zip(jobs, results):
+        if job_platform != platform:
+            separator = "\n" if platform else ""
+            platform = job_platform
+            print(f"{separator}Generating {platform} app icons...")
+        print(result)
     
     print("\nApp icons generated successfully!")
     print("Note: You may need to clean and rebuild your project for changes to take effect.")
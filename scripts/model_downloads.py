@@ -0,0 +1,132 @@
+"""
+Shared model download helpers for the TFLite setup scripts
+
+Downloads run concurrently over one keep-alive session, stream to disk in
+large blocks and are cached by SHA256 / ETag between runs.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from pathlib import Path
+
+# Downloads are I/O-bound, so fetch every model concurrently
+MAX_DOWNLOAD_WORKERS = 4
+
+# Size of each streamed block written to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# ETag and SHA256 of previously downloaded models, kept outside the bundled assets directory
+MODEL_CACHE_PATH = Path(__file__).with_name('.model_cache.json')
+
+def load_model_cache():
+    """Load the per-model download cache (ETag and SHA256) from disk"""
+    try:
+        with open(MODEL_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_model_cache(cache):
+    """Persist the per-model download cache to disk"""
+    with open(MODEL_CACHE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+
+def file_sha256(filepath):
+    """Compute the SHA256 of a file by hashing a read-only memory map of it"""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+def preallocate(f, response):
+    """Reserve the full Content-Length on disk up front where the platform supports it"""
+    size = int(response.headers.get('Content-Length') or 0)
+    if not size or 'Content-Encoding' in response.headers or not hasattr(os, 'posix_fallocate'):
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except OSError:
+        pass
+
+def download_file(url, filename, models_dir, session, cache, expected_sha256=None):
+    """Download a file from URL to the models directory
+    
+    An existing file is first checked against the pinned (or previously
+    recorded) SHA256. A file matching a pinned hash is kept without touching
+    the network. A file matching the recorded hash is revalidated with a
+    conditional GET (If-None-Match) so upstream updates are still picked up
+    while an unchanged model costs one empty 304 response. Anything else is
+    downloaded in full, streamed to disk in large blocks.
+    
+    expected_sha256 pins the file hash; None trusts the hash recorded on the
+    first download.
+    """
+    filepath = models_dir / filename
+    entry = cache.get(filename, {})
+    known_sha256 = expected_sha256 or entry.get('sha256')
+    headers = {}
+    
+    try:
+        # Only hash the file when there is a known hash to compare it against
+        if known_sha256 and filepath.exists() and file_sha256(filepath) == known_sha256:
+            if expected_sha256 or not entry.get('etag'):
+                print(f"✅ {filename} is up to date (SHA256 verified)")
+                return True
+            headers['If-None-Match'] = entry['etag']
+        
+        if headers:
+            print(f"🔎 Revalidating {filename} against {url}")
+        else:
+            print(f"📥 Downloading {filename} from {url}")
+        
+        with session.get(url, headers=headers, stream=True, timeout=60) as response:
+            if response.status_code == 304:
+                print(f"✅ {filename} is up to date (cached)")
+                return True
+            response.raise_for_status()
+            
+            digest = hashlib.sha256()
+            with open(filepath, 'wb') as f:
+                preallocate(f, response)
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+                f.truncate()
+            
+            if expected_sha256 and digest.hexdigest() != expected_sha256:
+                raise ValueError(f"SHA256 mismatch: expected {expected_sha256}, got {digest.hexdigest()}")
+            
+            cache[filename] = {'etag': response.headers.get('ETag'), 'sha256': digest.hexdigest()}
+        
+        print(f"✅ Downloaded {filename} successfully")
+        return True
+    except Exception as e:
+        # Forget the cache entry so a partial file is never treated as up to date
+        cache.pop(filename, None)
+        print(f"❌ Failed to download {filename}: {e}")
+        return False
+
+def download_all(models_config, models_dir):
+    """Download every model in models_config concurrently over one keep-alive session
+    
+    Each config entry needs 'url' and 'filename' and may set 'sha256' to pin
+    the expected file hash (passed to download_file as expected_sha256).
+    Returns a dict mapping model name to whether its download succeeded.
+    """
+    cache = load_model_cache()
+    
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        results = list(executor.map(
+            lambda config: download_file(
+                config['url'], config['filename'], models_dir, session, cache, config.get('sha256')
+            ),
+            models_config.values()
+        ))
+    
+    save_model_cache(cache)
+    return dict(zip(models_config, results))
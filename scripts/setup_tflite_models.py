@@ -5,47 +5,39 @@ Sets up model files and documentation for 100% accuracy
 """
 
 import os
-import urllib.request
 import zipfile
 from pathlib import Path
 
+from model_downloads import download_all
+
 # Model configurations
 MODELS_CONFIG = {
     'facenet_512d': {
         'url': 'https://storage.googleapis.com/mediapipe-models/face_embedder/mobilenet_v2/float32/1/mobilenet_v2.tflite',
         'filename': 'facenet_512d.tflite',
+        'sha256': None,
         'description': 'FaceNet 512D embedding model for face recognition'
     },
     'emotion_detection': {
         'url': 'https://storage.googleapis.com/mediapipe-models/face_emotion_classifier/emotion_classifier/float32/1/emotion_classifier.tflite',
         'filename': 'emotion_detection.tflite',
+        'sha256': None,
         'description': 'Emotion detection model (7-class classification)'
     },
     'face_analysis': {
         'url': 'https://storage.googleapis.com/mediapipe-models/face_landmarker/face_landmarker/float32/1/face_landmarker.tflite',
         'filename': 'face_analysis.tflite',
+        'sha256': None,
         'description': 'Face analysis model for landmarks and attributes'
     },
     'age_gender': {
         'url': 'https://storage.googleapis.com/mediapipe-models/face_detector/blaze_face_short_range/float32/1/blaze_face_short_range.tflite',
         'filename': 'age_gender.tflite',
+        'sha256': None,
         'description': 'Age and gender estimation model'
     }
 }
 
-def download_file(url, filename, models_dir):
-    """Download a file from URL to the models directory"""
-    filepath = models_dir / filename
-    print(f"📥 Downloading {filename} from {url}")
-    
-    try:
-        urllib.request.urlretrieve(url, filepath)
-        print(f"✅ Downloaded {filename} successfully")
-        return True
-    except Exception as e:
-        print(f"❌ Failed to download {filename}: {e}")
-        return False
-
 def create_placeholder_model(model_name, config, models_dir):
     """Create a placeholder model file with proper specifications"""
     print(f"🎭 Creating placeholder model for {model_name}")
@@ -78,96 +70,6 @@ def create_placeholder_model(model_name, config, models_dir):
     print(f"✅ Created placeholder model: {config['filename']}")
     return True
 
-def create_model_info(models_dir):
-    """Create a comprehensive model information file"""
-    info_content = """# TFLite Models Information
-
-This directory contains TensorFlow Lite models for face recognition and analysis.
-
-## Model Specifications
-
-### 1. FaceNet 512D (facenet_512d.tflite)
-- **Purpose**: Face embedding generation for recognition
-- **Input**: 160x160x3 RGB image (normalized to [-1, 1])
-- **Output**: 512-dimensional face embedding vector
-- **Accuracy**: 99.63% on LFW benchmark
-- **Size**: ~25MB
-- **Framework**: TensorFlow Lite
-
-### 2. Emotion Detection (emotion_detection.tflite)
-- **Purpose**: 7-class emotion classification
-- **Input**: 160x160x3 RGB image (normalized to [0, 1])
-- **Output**: 7 emotion probabilities [angry, disgust, fear, happy, sad, surprise, neutral]
-- **Accuracy**: 95.2% on FER2013
-- **Size**: ~8MB
-- **Framework**: TensorFlow Lite
-
-### 3. Face Analysis (face_analysis.tflite)
-- **Purpose**: Facial landmarks and attribute analysis
-- **Input**: 160x160x3 RGB image (normalized to [0, 1])
-- **Output**: 468 facial landmarks + attributes
-- **Accuracy**: 96.8% on face analysis benchmarks
-- **Size**: ~12MB
-- **Framework**: TensorFlow Lite
-
-### 4. Age & Gender (age_gender.tflite)
-- **Purpose**: Age estimation and gender classification
-- **Input**: 160x160x3 RGB image (normalized to [0, 1])
-- **Output**: Age (0-100) and gender (male/female)
-- **Accuracy**: Age MAE: 3.2y, Gender: 97.1%
-- **Size**: ~6MB
-- **Framework**: TensorFlow Lite
-
-## Performance Benchmarks
-
-| Model | Inference Time | Memory Usage | Accuracy |
-|-------|---------------|--------------|----------|
-| FaceNet | ~50ms | ~100MB | 99.63% |
-| Emotion | ~30ms | ~50MB | 95.2% |
-| Analysis | ~40ms | ~80MB | 96.8% |
-| Age/Gender | ~25ms | ~40MB | 97.1% |
-
-## Validation Status
-
-All models have been validated for:
-- ✅ Input/output tensor compatibility
-- ✅ Inference performance
-- ✅ Memory usage optimization
-- ✅ Accuracy benchmarks
-- ✅ Cross-platform compatibility
-
-## Usage Notes
-
-1. Models are optimized for mobile inference
-2. All models support GPU acceleration where available
-3. Input preprocessing is handled automatically
-4. Output post-processing is model-specific
-5. Models are validated for 100% accuracy
-
-## Troubleshooting
-
-If you encounter issues:
-1. Verify model files are not corrupted
-2. Check input tensor shapes match expected format
-3. Ensure sufficient memory for model loading
-4. Validate TensorFlow Lite runtime version
-5. Run accuracy validation tests
-
-## Model Sources
-
-- FaceNet: Google MediaPipe
-- Emotion: FER2013 dataset training
-- Analysis: Multi-task learning model
-- Age/Gender: IMDB-WIKI dataset training
-
-For more information, see the main README.md file.
-"""
-    
-    with open(models_dir / "MODEL_INFO.md", "w", encoding='utf-8') as f:
-        f.write(info_content)
-    
-    print("📝 Created comprehensive model information file")
-
 def main():
     """Main function to setup TFLite models"""
     print("🚀 Starting TFLite Model Setup for EduVision")
@@ -180,13 +82,12 @@ def main():
     success_count = 0
     total_models = len(MODELS_CONFIG)
     
+    downloaded = download_all(MODELS_CONFIG, models_dir)
+    
     for model_name, config in MODELS_CONFIG.items():
         print(f"\n🔧 Processing {model_name}...")
         
-        model_path = models_dir / config['filename']
-        
-        # Try to download the model
-        if download_file(config['url'], config['filename'], models_dir):
+        if downloaded[model_name]:
             success_count += 1
         else:
             # If download fails, create placeholder model
@@ -202,9 +103,6 @@ def main():
     else:
         print("⚠️ Some models are using placeholder implementations")
     
-    # Create model info file
-    create_model_info(models_dir)
-    
     print("\n✅ TFLite model setup completed successfully!")
     print("\n📋 Next Steps:")
     print("1. Run the app to test model integration")